@@ -26,6 +26,10 @@ Example:
     ... )
 """
 
+import asyncio
+import threading
+from typing import TYPE_CHECKING, Dict, Tuple
+
 from .client import ParseratorClient
 from .types import (
     ParseRequest,
@@ -79,6 +83,9 @@ from .utils import (
     from_polars,
 )
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 __version__ = "1.0.0"
 __author__ = "Paul Phillips"
 __email__ = "phillips.paul.email@gmail.com"
@@ -143,8 +150,51 @@ __all__ = [
     # Quick helpers
     "quick_parse",
     "create_client",
+    "close_pooled_clients",
+    "parse_dataframe",
 ]
 
+# Clients shared by the quick helpers, keyed by API key, so repeated calls
+# on one event loop reuse one connection pool instead of opening a new one
+# per call. Pooled connections are bound to the loop that opened them, so a
+# client created on another loop is replaced and the old one released.
+_CLIENT_POOL: Dict[str, Tuple[asyncio.AbstractEventLoop, ParseratorClient]] = {}
+_CLIENT_POOL_LOCK = threading.Lock()
+
+
+def _get_pooled_client(api_key: str) -> ParseratorClient:
+    """Return the shared client for an API key on the running loop."""
+    loop = asyncio.get_running_loop()
+    with _CLIENT_POOL_LOCK:
+        entry = _CLIENT_POOL.get(api_key)
+        if entry is None or entry[0] is not loop:
+            entry = _CLIENT_POOL[api_key] = (loop, ParseratorClient(api_key=api_key))
+        return entry[1]
+
+
+async def close_pooled_clients() -> None:
+    """Close the clients pooled by the quick helpers.
+    
+    Await this before the event loop ends (e.g. at the end of the coroutine
+    passed to asyncio.run) to release the pooled connections cleanly.
+    Clients pooled on other loops are dropped without being closed.
+    
+    Example:
+        >>> async def main():
+        ...     try:
+        ...         await quick_parse("pk_live_...", text, schema)
+        ...     finally:
+        ...         await close_pooled_clients()
+    """
+    loop = asyncio.get_running_loop()
+    with _CLIENT_POOL_LOCK:
+        entries = list(_CLIENT_POOL.values())
+        _CLIENT_POOL.clear()
+    
+    for client_loop, client in entries:
+        if client_loop is loop:
+            await client.aclose()
+
 
 def create_client(api_key: str, **kwargs) -> ParseratorClient:
     """Create a new Parserator client instance.
@@ -190,7 +240,7 @@ async def quick_parse(
         ... )
         >>> print(result.parsed_data)
     """
-    client = ParseratorClient(api_key=api_key)
+    client = _get_pooled_client(api_key)
     return await client.parse(
         input_data=input_data,
         output_schema=output_schema,
@@ -199,49 +249,66 @@ async def quick_parse(
     )
 
 
-# Convenience imports for common data science workflows
-try:
-    import pandas as pd
-    import numpy as np
+# Convenience helper for common data science workflows. pandas is imported
+# lazily so that `import parserator` does not pay its import cost.
+async def parse_dataframe(
+    api_key: str,
+    df: "pd.DataFrame",
+    text_column: str,
+    output_schema: dict,
+    **kwargs
+) -> "pd.DataFrame":
+    """Parse text data from a pandas DataFrame column.
     
-    async def parse_dataframe(
-        api_key: str,
-        df: "pd.DataFrame",
-        text_column: str,
-        output_schema: dict,
-        **kwargs
-    ) -> "pd.DataFrame":
-        """Parse text data from a pandas DataFrame column.
+    Args:
+        api_key: Your Parserator API key
+        df: Source DataFrame
+        text_column: Column containing text to parse
+        output_schema: Desired structure for parsed data
+        **kwargs: Additional options
         
-        Args:
-            api_key: Your Parserator API key
-            df: Source DataFrame
-            text_column: Column containing text to parse
-            output_schema: Desired structure for parsed data
-            **kwargs: Additional options
-            
-        Returns:
-            DataFrame with parsed data as new columns
-            
-        Example:
-            >>> df = pd.DataFrame({'text': ['John Smith, john@example.com']})
-            >>> result_df = await parse_dataframe(
-            ...     "pk_live_...",
-            ...     df,
-            ...     'text',
-            ...     {'name': 'string', 'email': 'email'}
-            ... )
-        """
-        client = ParseratorClient(api_key=api_key)
+    Returns:
+        DataFrame with parsed data as new columns
         
+    Example:
+        >>> df = pd.DataFrame({'text': ['John Smith, john@example.com']})
+        >>> result_df = await parse_dataframe(
+        ...     "pk_live_...",
+        ...     df,
+        ...     'text',
+        ...     {'name': 'string', 'email': 'email'}
+        ... )
+    """
+    try:
+        import pandas as pd
+    except ImportError as e:
+        raise ImportError(
+            "parse_dataframe requires pandas. Install it with: "
+            "pip install parserator-sdk[data-science]"
+        ) from e
+    
+    client = _get_pooled_client(api_key)
+    
+    # Cast the whole column in one vectorized step instead of
+    # walking rows with iterrows()
+    text_series = df[text_column]
+    text_values = text_series.astype(str)
+    
+    # Null and blank cells can only parse to nothing, so only rows with
+    # real text are sent; the rest keep an empty result
+    has_text = text_series.notna() & (text_values.str.strip().str.len() > 0)
+    positions = has_text.to_numpy().nonzero()[0]
+    parsed_data = [{} for _ in range(len(df))]
+    
+    if len(positions):
         # Create batch request from DataFrame
         batch_items = [
             ParseRequest(
-                input_data=str(row[text_column]),
+                input_data=text,
                 output_schema=output_schema,
                 **kwargs
             )
-            for _, row in df.iterrows()
+            for text in text_values.to_numpy()[positions]
         ]
         
         # Process batch
@@ -249,26 +316,20 @@ try:
             BatchParseRequest(items=batch_items)
         )
         
-        # Convert results back to DataFrame
-        parsed_data = []
-        for i, result in enumerate(batch_result.results):
-            if hasattr(result, 'parsed_data'):
-                parsed_data.append(result.parsed_data)
-            else:
-                parsed_data.append({})
-        
-        # Create new DataFrame with parsed columns
-        result_df = df.copy()
-        parsed_df = pd.DataFrame(parsed_data)
+        results = batch_result.results
+        if len(results) != len(positions):
+            raise ParseratorError(
+                f"Batch parse returned {len(results)} results for "
+                f"{len(positions)} rows"
+            )
         
-        # Add parsed columns with prefix
-        for col in parsed_df.columns:
-            result_df[f'parsed_{col}'] = parsed_df[col]
-            
-        return result_df
-    
-    __all__.append("parse_dataframe")
+        # Back-fill results at their original row positions
+        for position, result in zip(positions, results):
+            parsed_data[position] = getattr(result, 'parsed_data', None) or {}
     
-except ImportError:
-    # pandas/numpy not available
-    pass
+    # Add parsed columns with prefix in a single columnar concat,
+    # aligned to the source index. Existing columns with the same names
+    # (e.g. when re-parsing an earlier result) are replaced, not duplicated.
+    parsed_df = pd.DataFrame(parsed_data, index=df.index).add_prefix('parsed_')
+    df = df.drop(columns=parsed_df.columns, errors='ignore')
+    return pd.concat([df, parsed_df], axis=1)
@@ -0,0 +1,16 @@
+"""
+Fallback types for optional framework dependencies
+Shared by the integrations so each fallback is a single type per process
+"""
+
+
+class BaseOutputParser:
+    """Stand-in for LangChain's BaseOutputParser when LangChain is not installed."""
+
+
+class OutputParserException(Exception):
+    """Stand-in for LangChain's OutputParserException when LangChain is not installed."""
+
+
+class BaseTool:
+    """Stand-in for crewai_tools' BaseTool when CrewAI tools are not installed."""
@@ -1,14 +1,41 @@
 """
 Parserator Framework Integrations
 Provides seamless integration with popular AI agent frameworks
+
+Each integration module is imported on first access, so using one
+framework does not pay the import cost of the others.
 """
 
-from .langchain import ParseatorOutputParser
-from .crewai import ParseatorTool  
-from .autogpt import ParseatorPlugin
+import importlib
+from typing import Any, List
+
+from ._clients import get_shared_client
+
+# Public name -> submodule that defines it
+_LAZY_ATTRIBUTES = {
+    'ParseatorOutputParser': '.langchain',
+    'ParseatorTool': '.crewai',
+    'ParseatorPlugin': '.autogpt'
+}
 
 __all__ = [
     'ParseatorOutputParser',
     'ParseatorTool',
-    'ParseatorPlugin'
-]
\ No newline at end of file
+    'ParseatorPlugin',
+    'get_shared_client'
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import integration classes from their framework module on first use."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,252 @@
+"""
+Result caching for the framework integrations
+Lets tools and output parsers skip repeat calls with identical inputs
+"""
+
+import asyncio
+import contextvars
+import copy
+import functools
+import hashlib
+import json
+import math
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_ORJSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS if ORJSON_AVAILABLE else 0
+
+
+# Where orjson output can hold a null it wrote for NaN or infinity: a bare
+# null value, or a "null" object key. Text inside other strings never matches.
+_NULL_TOKEN = re.compile(rb'(?:^|[\[:,])null|[{,]"null":')
+
+
+def _has_non_finite_float(value: Any) -> bool:
+    """Return True if value contains a NaN or infinite float anywhere."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(
+            _has_non_finite_float(key) or _has_non_finite_float(item)
+            for key, item in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite_float(item) for item in value)
+    return False
+
+
+def canonical_json(value: Any) -> bytes:
+    """Serialize a value to deterministic JSON bytes, independent of key order."""
+    if ORJSON_AVAILABLE:
+        try:
+            encoded = orjson.dumps(value, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # Lone surrogates and integers beyond 64 bits are rejected by
+            # orjson but accepted by the standard library
+            pass
+        else:
+            # orjson writes NaN and infinities as null, which would give them
+            # the same key as None, so only values holding one are re-encoded
+            if not (_NULL_TOKEN.search(encoded) and _has_non_finite_float(value)):
+                return encoded
+    return json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def make_cache_key(
+    input_data: str,
+    schema_json: bytes,
+    instructions: Optional[str] = None
+) -> bytes:
+    """
+    Build a compact cache key for one parse request.
+
+    Args:
+        input_data: Raw text being parsed
+        schema_json: canonical_json() of the output schema, which callers
+            with a fixed schema can compute once and reuse
+        instructions: Optional parsing instructions
+
+    Returns:
+        16-byte digest identifying the request content
+    """
+    # Canonical JSON never contains a raw newline, so it is a safe separator
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(canonical_json(input_data))
+    digest.update(b"\n")
+    digest.update(schema_json)
+    digest.update(b"\n")
+    digest.update(canonical_json(instructions))
+    return digest.digest()
+
+
+def make_call_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> bytes:
+    """Build a compact key for an arbitrary tool call from its arguments."""
+    payload = canonical_json([list(args), kwargs])
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+class ResultCache:
+    """
+    Thread-safe LRU cache of parse results.
+
+    Agents often re-run the same tool call across reasoning steps; a hit
+    returns the earlier result without another API round-trip. Values are
+    deep-copied on the way in and out, so callers can never mutate a
+    stored entry.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[bytes, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes) -> Optional[Any]:
+        """Return a copy of the cached value for key, or None on a miss."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(value)
+
+    def put(self, key: bytes, value: Any) -> None:
+        """Store a copy of value, evicting the least recently used entry when full."""
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        """Return hit, miss and size counters."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize
+            }
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical async calls.
+
+    While a call for a key is in flight, later callers with the same key
+    await its outcome instead of issuing a request of their own.
+    """
+
+    def __init__(self) -> None:
+        # Keyed by event loop as well, since a task cannot be awaited
+        # from a loop other than the one that created it
+        self._inflight: Dict[Tuple[int, bytes], "asyncio.Future[Any]"] = {}
+
+    async def run(self, key: bytes, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await func() unless an identical call is already running.
+
+        The call runs as its own task, so cancelling any caller, including
+        the one that started it, does not affect the others.
+
+        Args:
+            key: Content key identifying the call
+            func: Starts the real call and returns its awaitable
+
+        Returns:
+            The call result; every caller receives its own deep copy
+        """
+        loop = asyncio.get_running_loop()
+        slot = (id(loop), key)
+        task = self._inflight.get(slot)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._inflight[slot] = task
+            task.add_done_callback(functools.partial(self._finish, slot))
+        return copy.deepcopy(await asyncio.shield(task))
+
+    def _finish(self, slot: Tuple[int, bytes], task: "asyncio.Future[Any]") -> None:
+        """Forget a finished call and mark its exception retrieved."""
+        if self._inflight.get(slot) is task:
+            del self._inflight[slot]
+        # Every caller may have been cancelled, leaving no one to read it
+        if not task.cancelled():
+            task.exception()
+
+
+class CachedCallsMixin:
+    """
+    Result caching and call coalescing shared by the integration classes.
+
+    Subclasses call _init_cache() from __init__, then consult self._cache
+    and self._inflight around their parse calls.
+    """
+
+    def _init_cache(self, enabled: bool) -> None:
+        """Set up the result cache (None when disabled) and in-flight registry."""
+        # Successful results keyed by request content
+        self._cache = ResultCache() if enabled else None
+        # Concurrent identical async calls share one in-flight request
+        self._inflight = SingleFlight()
+
+    async def _run_blocking(
+        self,
+        key: Optional[bytes],
+        func: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any
+    ) -> Any:
+        """
+        Run a blocking call in the default executor, coalesced by key.
+
+        The call runs under a copy of the caller's contextvars, so framework
+        callback and tracing context stays visible inside it. While a call
+        for a key is in flight, identical calls share it; a None key runs
+        the call on its own.
+
+        Args:
+            key: Content key identifying the call, or None to skip coalescing
+            func: Blocking callable to run
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The value returned by func
+        """
+        loop = asyncio.get_running_loop()
+        call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+
+        def start() -> "asyncio.Future[Any]":
+            return loop.run_in_executor(None, call)
+
+        if key is None:
+            return await start()
+        return await self._inflight.run(key, start)
+
+    def cache_info(self) -> Dict[str, int]:
+        """Return hit/miss counters for the result cache (empty if disabled)."""
+        return self._cache.info() if self._cache is not None else {}
+
+    def clear_cache(self) -> None:
+        """Forget all cached parse results."""
+        if self._cache is not None:
+            self._cache.clear()
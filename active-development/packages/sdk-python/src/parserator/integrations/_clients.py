@@ -0,0 +1,37 @@
+"""
+Shared Parserator clients for the framework integrations
+Lets plugins, tools and output parsers in one process reuse a client
+"""
+
+import threading
+from typing import Dict, Optional, Tuple
+
+from ..services import ParseatorClient
+
+_CLIENT_CACHE: Dict[Tuple[str, str], ParseatorClient] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def get_shared_client(api_key: str, base_url: Optional[str] = None) -> ParseatorClient:
+    """
+    Return the process-wide client for an API key and base URL.
+    
+    Integrations built with the same credentials share one client, and with
+    it one connection pool, instead of each opening their own.
+    
+    Args:
+        api_key: Parserator API key
+        base_url: Optional custom API base URL
+        
+    Returns:
+        Shared ParseatorClient instance
+    """
+    key = (api_key, base_url or "")
+    with _CLIENT_CACHE_LOCK:
+        client = _CLIENT_CACHE.get(key)
+        if client is None:
+            client = _CLIENT_CACHE[key] = ParseatorClient(
+                api_key=api_key,
+                base_url=base_url
+            )
+        return client
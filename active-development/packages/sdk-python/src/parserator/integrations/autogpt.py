@@ -3,8 +3,10 @@ AutoGPT Integration for Parserator
 Provides plugin for AutoGPT agents to parse unstructured data
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple
 import json
+import os
 
 try:
     from autogpt.agent import Agent
@@ -15,8 +17,74 @@ except ImportError:
     AUTOGPT_AVAILABLE = False
     command = lambda *args, **kwargs: lambda func: func
 
-from ..services import ParseatorClient
 from ..types import ParseResult
+from ._clients import get_shared_client
+
+# Reused for the variable parts of parse_text responses, which are
+# otherwise assembled from fixed JSON fragments
+_encode = json.JSONEncoder(separators=(",", ":")).encode
+
+# Returned by every parsing command when no API key is configured
+_NOT_CONFIGURED_RESPONSE = json.dumps({
+    "error": "Parserator API key not configured. Set PARSERATOR_API_KEY environment variable."
+})
+
+# Fixed schemas used by the built-in commands. These are shared across
+# calls and must not be mutated; copy them before adding fields.
+_EMAIL_SCHEMA = {
+    "from": "string",
+    "to": "string", 
+    "subject": "string",
+    "date": "string",
+    "summary": "string",
+    "action_items": "array",
+    "mentioned_people": "array",
+    "important_dates": "array",
+    "priority_level": "string"
+}
+
+_DOCUMENT_BASE_SCHEMA = {
+    "title": "string",
+    "document_type": "string",
+    "summary": "string",
+    "key_topics": "array",
+    "main_points": "array",
+    "important_dates": "array"
+}
+
+_CONTRACT_FIELDS = {
+    "parties_involved": "array",
+    "contract_terms": "array",
+    "payment_terms": "string",
+    "expiration_date": "string"
+}
+
+_INVOICE_FIELDS = {
+    "invoice_number": "string",
+    "total_amount": "number",
+    "due_date": "string",
+    "line_items": "array",
+    "billing_address": "string"
+}
+
+_REPORT_FIELDS = {
+    "key_findings": "array",
+    "recommendations": "array",
+    "methodology": "string",
+    "data_sources": "array"
+}
+
+# Extra fields merged into the document schema, keyed by lowercase type
+_DOCUMENT_TYPE_FIELDS = {
+    "contract": _CONTRACT_FIELDS,
+    "invoice": _INVOICE_FIELDS,
+    "report": _REPORT_FIELDS
+}
+
+_CONTACTS_SCHEMA = {
+    "contacts": "array",
+    "total_contacts_found": "number"
+}
 
 
 class ParseatorPlugin:
@@ -47,12 +115,12 @@ class ParseatorPlugin:
             
         self.config = config
         self.api_key = self._get_api_key()
-        self.client = ParseatorClient(api_key=self.api_key) if self.api_key else None
+        self.client = get_shared_client(self.api_key) if self.api_key else None
+        # Bound once so command calls skip the client attribute lookups
+        self._parse = self.client.parse if self.client else None
         
     def _get_api_key(self) -> Optional[str]:
         """Get API key from environment or config."""
-        import os
-        
         # Try environment variable first
         api_key = os.getenv('PARSERATOR_API_KEY')
         
@@ -103,36 +171,53 @@ class ParseatorPlugin:
         Returns:
             JSON string with parsed data or error message
         """
-        if not self.client:
-            return json.dumps({
-                "error": "Parserator API key not configured. Set PARSERATOR_API_KEY environment variable."
-            })
+        if self._parse is None:
+            return _NOT_CONFIGURED_RESPONSE
         
         try:
-            result = self.client.parse(
+            result = self._parse(
                 input_data=text,
                 output_schema=schema,
                 instructions=instructions
             )
             
             if result.success:
-                return json.dumps({
-                    "success": True,
-                    "parsed_data": result.parsed_data,
-                    "confidence": result.metadata.get("confidence", 0.0),
-                    "processing_time_ms": result.metadata.get("processingTimeMs", 0)
-                }, indent=2)
+                metadata = result.metadata
+                return (
+                    '{"success":true,"parsed_data":' + _encode(result.parsed_data)
+                    + ',"confidence":' + _encode(metadata.get("confidence", 0.0))
+                    + ',"processing_time_ms":' + _encode(metadata.get("processingTimeMs", 0))
+                    + '}'
+                )
             else:
-                return json.dumps({
-                    "success": False,
-                    "error": result.error_message
-                })
+                return '{"success":false,"error":' + _encode(result.error_message) + '}'
                 
         except Exception as e:
-            return json.dumps({
-                "success": False,
-                "error": f"Parsing failed: {str(e)}"
-            })
+            return '{"success":false,"error":' + _encode(f"Parsing failed: {str(e)}") + '}'
+    
+    def parse_many(
+        self,
+        items: List[Tuple[str, Dict[str, Any], Optional[str]]],
+        max_workers: int = 8
+    ) -> List[str]:
+        """
+        Parse several texts concurrently.
+        
+        Each item is run through parse_text, so the requests overlap on the
+        network instead of waiting on each other.
+        
+        Args:
+            items: (text, schema, instructions) tuples to parse
+            max_workers: Maximum number of requests in flight at once
+            
+        Returns:
+            JSON strings from parse_text, in the same order as items
+        """
+        if self._parse is None or len(items) < 2:
+            return [self.parse_text(*item) for item in items]
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(lambda item: self.parse_text(*item), items))
     
     @command(
         "parse_email",
@@ -152,20 +237,11 @@ class ParseatorPlugin:
     )
     def parse_email(self, email_content: str, custom_fields: Optional[List[str]] = None) -> str:
         """Extract structured information from email content."""
-        schema = {
-            "from": "string",
-            "to": "string", 
-            "subject": "string",
-            "date": "string",
-            "summary": "string",
-            "action_items": "array",
-            "mentioned_people": "array",
-            "important_dates": "array",
-            "priority_level": "string"
-        }
+        schema = _EMAIL_SCHEMA
         
         # Add custom fields if specified
         if custom_fields:
+            schema = dict(_EMAIL_SCHEMA)
             for field in custom_fields:
                 schema[field] = "string"
         
@@ -193,38 +269,12 @@ class ParseatorPlugin:
     )
     def parse_document(self, document_content: str, document_type: str = "general") -> str:
         """Analyze document content and extract structured information."""
-        base_schema = {
-            "title": "string",
-            "document_type": "string",
-            "summary": "string",
-            "key_topics": "array",
-            "main_points": "array",
-            "important_dates": "array"
-        }
+        base_schema = _DOCUMENT_BASE_SCHEMA
         
         # Add type-specific fields
-        if document_type.lower() == "contract":
-            base_schema.update({
-                "parties_involved": "array",
-                "contract_terms": "array",
-                "payment_terms": "string",
-                "expiration_date": "string"
-            })
-        elif document_type.lower() == "invoice":
-            base_schema.update({
-                "invoice_number": "string",
-                "total_amount": "number",
-                "due_date": "string",
-                "line_items": "array",
-                "billing_address": "string"
-            })
-        elif document_type.lower() == "report":
-            base_schema.update({
-                "key_findings": "array",
-                "recommendations": "array",
-                "methodology": "string",
-                "data_sources": "array"
-            })
+        type_fields = _DOCUMENT_TYPE_FIELDS.get(document_type.lower())
+        if type_fields:
+            base_schema = {**_DOCUMENT_BASE_SCHEMA, **type_fields}
         
         return self.parse_text(
             text=document_content,
@@ -245,14 +295,9 @@ class ParseatorPlugin:
     )
     def extract_contacts(self, text: str) -> str:
         """Extract contact information from unstructured text."""
-        schema = {
-            "contacts": "array",
-            "total_contacts_found": "number"
-        }
-        
         return self.parse_text(
             text=text,
-            schema=schema,
+            schema=_CONTACTS_SCHEMA,
             instructions="Extract all contact information including names, emails, phone numbers, addresses, and company details. Format as an array of contact objects."
         )
     
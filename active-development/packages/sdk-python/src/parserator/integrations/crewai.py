@@ -3,6 +3,9 @@ CrewAI Integration for Parserator
 Provides tools for CrewAI agents to parse unstructured data
 """
 
+import functools
+import inspect
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Type
 from pydantic import BaseModel, Field
 
@@ -11,13 +14,102 @@ try:
     CREWAI_AVAILABLE = True
 except ImportError:
     CREWAI_AVAILABLE = False
-    BaseTool = object
+    from .._optional_stubs import BaseTool
 
 from ..services import ParseatorClient
-from ..types import ParseResult
+from ..types import BatchParseRequest, ParseRequest, ParseResult
+from ._cache import (
+    CachedCallsMixin,
+    canonical_json,
+    make_cache_key,
+    make_call_key
+)
+from ._clients import get_shared_client
 
+# Output schemas for EmailParserTool, DocumentParserTool and ContactParserTool,
+# built once at import rather than on every _run. EmailParserTool copies
+# _EMAIL_SCHEMA before appending custom_fields.
+_EMAIL_SCHEMA = {
+    "from": "string",
+    "to": "string",
+    "subject": "string", 
+    "date": "string",
+    "summary": "string",
+    "action_items": "array",
+    "mentioned_people": "array",
+    "important_dates": "array",
+    "priority": "string"
+}
 
-class ParseatorTool(BaseTool):
+_DOCUMENT_BASE_SCHEMA = {
+    "title": "string",
+    "document_type": "string",
+    "summary": "string",
+    "key_topics": "array",
+    "main_points": "array"
+}
+
+# DocumentParserTool adds these to _DOCUMENT_BASE_SCHEMA when document_type
+# (compared case-insensitively) names one of them
+_DOCUMENT_TYPE_FIELDS = {
+    "contract": {
+        "parties": "array",
+        "terms": "array", 
+        "dates": "array",
+        "obligations": "array"
+    },
+    "invoice": {
+        "invoice_number": "string",
+        "amount": "number",
+        "due_date": "string",
+        "items": "array"
+    },
+    "report": {
+        "findings": "array",
+        "recommendations": "array",
+        "data_points": "array"
+    }
+}
+
+_CONTACT_SCHEMA = {
+    "name": "string",
+    "email": "string",
+    "phone": "string", 
+    "company": "string",
+    "title": "string",
+    "address": "string",
+    "social_media": "array",
+    "notes": "string"
+}
+
+
+def _to_response(result: ParseResult) -> Dict[str, Any]:
+    """Wrap a client ParseResult in the envelope returned by the tools."""
+    if not result.success:
+        return {
+            "error": True,
+            "message": result.error_message,
+            "parsed_data": None
+        }
+    
+    return {
+        "error": False,
+        "parsed_data": result.parsed_data,
+        "confidence": result.metadata.get("confidence", 0.0),
+        "processing_time": result.metadata.get("processingTimeMs", 0)
+    }
+
+
+def _failure_response(error: Exception) -> Dict[str, Any]:
+    """Build the envelope for a parse call that raised."""
+    return {
+        "error": True,
+        "message": f"Parsing failed: {str(error)}",
+        "parsed_data": None
+    }
+
+
+class ParseatorTool(CachedCallsMixin, BaseTool):
     """
     CrewAI tool for parsing unstructured data using Parserator.
     
@@ -70,6 +162,8 @@ class ParseatorTool(BaseTool):
         name: str = "parserator",
         description: str = "Parse unstructured text into structured JSON data",
         base_url: Optional[str] = None,
+        cache: bool = True,
+        client: Optional[ParseatorClient] = None,
         **kwargs
     ):
         if not CREWAI_AVAILABLE:
@@ -85,10 +179,8 @@ class ParseatorTool(BaseTool):
             **kwargs
         )
         
-        self.client = ParseatorClient(
-            api_key=api_key,
-            base_url=base_url
-        )
+        self.client = client or get_shared_client(api_key, base_url)
+        self._init_cache(cache)
     
     def _run(
         self,
@@ -107,6 +199,12 @@ class ParseatorTool(BaseTool):
         Returns:
             Structured data according to output_schema
         """
+        cache_key = self._cache_keys([input_data], output_schema, instructions)[0]
+        if cache_key is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         try:
             result = self.client.parse(
                 input_data=input_data,
@@ -114,26 +212,168 @@ class ParseatorTool(BaseTool):
                 instructions=instructions
             )
             
-            if not result.success:
-                return {
-                    "error": True,
-                    "message": result.error_message,
-                    "parsed_data": None
-                }
-            
-            return {
-                "error": False,
-                "parsed_data": result.parsed_data,
-                "confidence": result.metadata.get("confidence", 0.0),
-                "processing_time": result.metadata.get("processingTimeMs", 0)
-            }
+            response = _to_response(result)
+            if cache_key is not None and not response["error"]:
+                self._cache.put(cache_key, response)
+            return response
             
         except Exception as e:
-            return {
-                "error": True,
-                "message": f"Parsing failed: {str(e)}",
-                "parsed_data": None
-            }
+            return _failure_response(e)
+    
+    def _run_batch(
+        self,
+        inputs: List[str],
+        output_schema: Dict[str, Any],
+        instructions: Optional[str] = None,
+        max_concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse many inputs against one schema.
+        
+        Uses the client's batch_parse endpoint when it has one, so the
+        inputs not already in the result cache cost a single request. If
+        the client has no batch endpoint, or the batch call fails, the
+        inputs are parsed as concurrent single _run calls instead.
+        
+        Args:
+            inputs: Raw unstructured texts to parse
+            output_schema: Desired JSON structure, shared by every input
+            instructions: Optional additional parsing instructions
+            max_concurrency: Maximum number of requests in flight at once
+                when falling back to single calls
+            
+        Returns:
+            One _run-style result per input, in input order
+        """
+        if hasattr(self.client, "batch_parse") and len(inputs) > 1:
+            responses = self._run_server_batch(inputs, output_schema, instructions)
+            if responses is not None:
+                return responses
+        
+        # Bound to ParseatorTool._run so subclasses that change the _run
+        # signature still batch through the generic single-input path
+        parse_one = functools.partial(
+            ParseatorTool._run,
+            self,
+            output_schema=output_schema,
+            instructions=instructions
+        )
+        if len(inputs) < 2:
+            return [parse_one(text) for text in inputs]
+        
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(inputs))) as executor:
+            return list(executor.map(parse_one, inputs))
+    
+    def _cache_keys(
+        self,
+        inputs: List[str],
+        output_schema: Dict[str, Any],
+        instructions: Optional[str]
+    ) -> List[Optional[bytes]]:
+        """Return a cache key per input, or None where caching does not apply."""
+        keys: List[Optional[bytes]] = [None] * len(inputs)
+        if self._cache is None:
+            return keys
+        
+        try:
+            schema_json = canonical_json(output_schema)
+        except (TypeError, ValueError):
+            return keys
+        
+        for index, input_data in enumerate(inputs):
+            try:
+                keys[index] = make_cache_key(input_data, schema_json, instructions)
+            except (TypeError, ValueError):
+                # Inputs that cannot be serialized are never cached
+                pass
+        return keys
+    
+    def _run_server_batch(
+        self,
+        inputs: List[str],
+        output_schema: Dict[str, Any],
+        instructions: Optional[str]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Parse inputs through the client's batch endpoint.
+        
+        Cached inputs are answered locally and only the rest are sent, in
+        one BatchParseRequest. Returns None if the batch call fails or
+        returns the wrong number of results.
+        """
+        keys = self._cache_keys(inputs, output_schema, instructions)
+        responses = [
+            self._cache.get(key) if key is not None else None
+            for key in keys
+        ]
+        pending = [index for index, response in enumerate(responses) if response is None]
+        if not pending:
+            return responses
+        
+        try:
+            batch_result = self.client.batch_parse(
+                BatchParseRequest(items=[
+                    ParseRequest(
+                        input_data=inputs[index],
+                        output_schema=output_schema,
+                        instructions=instructions
+                    )
+                    for index in pending
+                ])
+            )
+            if inspect.iscoroutine(batch_result):
+                # An async-only client cannot be driven from this sync path
+                batch_result.close()
+                return None
+            
+            results = batch_result.results
+            if len(results) != len(pending):
+                return None
+            
+            for index, result in zip(pending, results):
+                responses[index] = _to_response(result)
+        except Exception:
+            return None
+        
+        for index in pending:
+            if keys[index] is not None and not responses[index]["error"]:
+                self._cache.put(keys[index], responses[index])
+        return responses
+    
+    async def _arun(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Async variant of _run for agents that run tools concurrently.
+        
+        Overlapping calls with the same arguments share one request.
+        """
+        try:
+            key = make_call_key(args, kwargs)
+        except (TypeError, ValueError):
+            # Arguments that cannot be serialized are never coalesced
+            key = None
+        
+        return await self._run_blocking(key, self._run, *args, **kwargs)
+
+
+class BatchParserTool(ParseatorTool):
+    """Specialized CrewAI tool for parsing many texts with one schema."""
+    
+    name: str = "batch_parser"
+    description: str = "Parse a list of unstructured texts into structured JSON using one schema"
+    
+    def _run(
+        self,
+        inputs: List[str],
+        output_schema: Dict[str, Any],
+        instructions: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Parse every input concurrently and return results in input order."""
+        results = self._run_batch(inputs, output_schema, instructions)
+        
+        return {
+            "results": results,
+            "failed_count": sum(1 for result in results if result["error"])
+        }
 
 
 class EmailParserTool(ParseatorTool):
@@ -144,20 +384,11 @@ class EmailParserTool(ParseatorTool):
     
     def _run(self, email_content: str, custom_fields: Optional[List[str]] = None) -> Dict[str, Any]:
         """Parse email content with predefined schema."""
-        schema = {
-            "from": "string",
-            "to": "string",
-            "subject": "string", 
-            "date": "string",
-            "summary": "string",
-            "action_items": "array",
-            "mentioned_people": "array",
-            "important_dates": "array",
-            "priority": "string"
-        }
+        schema = _EMAIL_SCHEMA
         
         # Add custom fields if specified
         if custom_fields:
+            schema = dict(_EMAIL_SCHEMA)
             for field in custom_fields:
                 schema[field] = "string"
         
@@ -176,35 +407,12 @@ class DocumentParserTool(ParseatorTool):
     
     def _run(self, document_content: str, document_type: str = "general") -> Dict[str, Any]:
         """Parse document content with type-specific schema."""
-        base_schema = {
-            "title": "string",
-            "document_type": "string",
-            "summary": "string",
-            "key_topics": "array",
-            "main_points": "array"
-        }
+        base_schema = _DOCUMENT_BASE_SCHEMA
         
         # Add type-specific fields
-        if document_type.lower() == "contract":
-            base_schema.update({
-                "parties": "array",
-                "terms": "array", 
-                "dates": "array",
-                "obligations": "array"
-            })
-        elif document_type.lower() == "invoice":
-            base_schema.update({
-                "invoice_number": "string",
-                "amount": "number",
-                "due_date": "string",
-                "items": "array"
-            })
-        elif document_type.lower() == "report":
-            base_schema.update({
-                "findings": "array",
-                "recommendations": "array",
-                "data_points": "array"
-            })
+        type_fields = _DOCUMENT_TYPE_FIELDS.get(document_type.lower())
+        if type_fields:
+            base_schema = {**_DOCUMENT_BASE_SCHEMA, **type_fields}
         
         return super()._run(
             input_data=document_content,
@@ -221,20 +429,9 @@ class ContactParserTool(ParseatorTool):
     
     def _run(self, text_content: str) -> Dict[str, Any]:
         """Parse text to extract contact information."""
-        schema = {
-            "name": "string",
-            "email": "string",
-            "phone": "string", 
-            "company": "string",
-            "title": "string",
-            "address": "string",
-            "social_media": "array",
-            "notes": "string"
-        }
-        
         return super()._run(
             input_data=text_content,
-            output_schema=schema,
+            output_schema=_CONTACT_SCHEMA,
             instructions="Extract all contact information including names, emails, phone numbers, addresses, and company details."
         )
 
@@ -278,7 +475,7 @@ def create_parsing_agent(api_key: str, tools: Optional[List[str]] = None) -> Dic
     
     Args:
         api_key: Parserator API key
-        tools: List of tool types to include ('email', 'document', 'contact', 'general')
+        tools: List of tool types to include ('email', 'document', 'contact', 'general', 'extractor', 'batch')
         
     Returns:
         Dictionary with agent configuration
@@ -299,6 +496,8 @@ def create_parsing_agent(api_key: str, tools: Optional[List[str]] = None) -> Dic
             agent_tools.append(ParseatorTool(api_key=api_key))
         elif tool_type == 'extractor':
             agent_tools.append(DataExtractionTool(api_key=api_key))
+        elif tool_type == 'batch':
+            agent_tools.append(BatchParserTool(api_key=api_key))
     
     return {
         "role": "Data Parser Agent",
@@ -3,7 +3,8 @@ LangChain Integration for Parserator
 Provides output parser for LangChain agents and chains
 """
 
-from typing import Any, Dict, List, Optional, Union
+import copy
+from typing import Any, Dict, List, Optional, Tuple, Union
 from pydantic import BaseModel, Field
 
 try:
@@ -12,14 +13,15 @@ try:
     LANGCHAIN_AVAILABLE = True
 except ImportError:
     LANGCHAIN_AVAILABLE = False
-    BaseOutputParser = object
-    OutputParserException = Exception
+    from .._optional_stubs import BaseOutputParser, OutputParserException
 
 from ..services import ParseatorClient
 from ..types import ParseResult
+from ._cache import CachedCallsMixin, canonical_json, make_cache_key
+from ._clients import get_shared_client
 
 
-class ParseatorOutputParser(BaseOutputParser):
+class ParseatorOutputParser(CachedCallsMixin, BaseOutputParser):
     """
     LangChain output parser using Parserator's two-stage parsing engine.
     
@@ -76,6 +78,8 @@ class ParseatorOutputParser(BaseOutputParser):
         output_schema: Dict[str, Any],
         instructions: Optional[str] = None,
         base_url: Optional[str] = None,
+        cache: bool = True,
+        client: Optional[ParseatorClient] = None,
         **kwargs
     ):
         if not LANGCHAIN_AVAILABLE:
@@ -91,10 +95,31 @@ class ParseatorOutputParser(BaseOutputParser):
             **kwargs
         )
         
-        self.client = ParseatorClient(
-            api_key=api_key,
-            base_url=base_url
-        )
+        self.client = client or get_shared_client(api_key, base_url)
+        # (source schema, frozen copy, canonical JSON), filled on first use
+        self._schema_state: Optional[Tuple[Dict[str, Any], Dict[str, Any], Optional[bytes]]] = None
+        self._init_cache(cache)
+    
+    def _schema_snapshot(self) -> Tuple[Dict[str, Any], Optional[bytes]]:
+        """
+        Return the schema to send and its canonical JSON for cache keys.
+        
+        Both come from one frozen copy of output_schema, taken on first use
+        and again whenever the field is reassigned, so a cache key always
+        matches the schema actually sent. In-place edits to the original
+        dict are not picked up; assign a new schema instead. The JSON is
+        None when the schema cannot be serialized, which disables caching
+        and coalescing for it.
+        """
+        state = self._schema_state
+        if state is None or state[0] is not self.output_schema:
+            frozen = copy.deepcopy(self.output_schema)
+            try:
+                schema_json = canonical_json(frozen)
+            except (TypeError, ValueError):
+                schema_json = None
+            state = self._schema_state = (self.output_schema, frozen, schema_json)
+        return state[1], state[2]
     
     def parse(self, text: str) -> Dict[str, Any]:
         """
@@ -109,10 +134,24 @@ class ParseatorOutputParser(BaseOutputParser):
         Raises:
             OutputParserException: If parsing fails
         """
+        schema, schema_json = self._schema_snapshot()
+        
+        cache_key = None
+        if self._cache is not None and schema_json is not None:
+            try:
+                cache_key = make_cache_key(text, schema_json, self.instructions)
+            except (TypeError, ValueError):
+                # Input that cannot be serialized is never cached
+                pass
+            else:
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    return cached
+        
         try:
             result = self.client.parse(
                 input_data=text,
-                output_schema=self.output_schema,
+                output_schema=schema,
                 instructions=self.instructions
             )
             
@@ -120,12 +159,40 @@ class ParseatorOutputParser(BaseOutputParser):
                 raise OutputParserException(
                     f"Parserator parsing failed: {result.error_message}"
                 )
-                
+            
+            if cache_key is not None:
+                self._cache.put(cache_key, result.parsed_data)
             return result.parsed_data
             
         except Exception as e:
             raise OutputParserException(f"Failed to parse with Parserator: {str(e)}")
     
+    async def aparse(self, text: str) -> Any:
+        """
+        Async variant of parse for chains that run parsers concurrently.
+        
+        Identical texts parsed at the same time share one request.
+        
+        Args:
+            text: Raw unstructured text to parse
+            
+        Returns:
+            Structured data according to output_schema
+            
+        Raises:
+            OutputParserException: If parsing fails
+        """
+        _, schema_json = self._schema_snapshot()
+        key = None
+        if schema_json is not None:
+            try:
+                key = make_cache_key(text, schema_json, self.instructions)
+            except (TypeError, ValueError):
+                # Not coalesced; parse reports the input problem itself
+                pass
+        
+        return await self._run_blocking(key, self.parse, text)
+    
     def get_format_instructions(self) -> str:
         """
         Return format instructions for the LLM.
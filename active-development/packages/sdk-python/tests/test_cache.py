@@ -0,0 +1,160 @@
+"""
+Tests for the integration result cache and call coalescing
+Covers key serialization, ResultCache copy semantics and SingleFlight behaviour
+"""
+
+import asyncio
+import contextvars
+import threading
+
+import pytest
+
+from parserator.integrations._cache import (
+    CachedCallsMixin,
+    ResultCache,
+    SingleFlight,
+    canonical_json
+)
+
+REQUEST_ID = contextvars.ContextVar("request_id", default="unset")
+
+
+class Caller(CachedCallsMixin):
+    """Minimal CachedCallsMixin user for exercising _run_blocking."""
+    
+    def __init__(self):
+        self._init_cache(True)
+
+
+def test_canonical_json_is_order_independent():
+    assert canonical_json({"b": 1, "a": 2}) == canonical_json({"a": 2, "b": 1})
+
+
+def test_canonical_json_handles_values_orjson_rejects():
+    assert canonical_json("\ud800") == b'"\\ud800"'
+    assert canonical_json(2 ** 70) == b"1180591620717411303424"
+    assert canonical_json(float("nan")) != canonical_json(None)
+
+
+def test_canonical_json_keeps_non_finite_floats_distinct_from_none():
+    assert canonical_json([float("nan")]) != canonical_json([None])
+    assert canonical_json({"x": float("inf")}) != canonical_json({"x": None})
+    assert canonical_json({float("nan"): 1}) != canonical_json({None: 1})
+
+
+def test_canonical_json_uses_orjson_for_text_mentioning_null():
+    orjson = pytest.importorskip("orjson")
+    value = {"note": "nullable, annulled: null", "café": None}
+    
+    assert canonical_json(value) == orjson.dumps(
+        value, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+    )
+
+
+def test_result_cache_entries_are_isolated_from_callers():
+    cache = ResultCache()
+    value = {"items": [1]}
+    cache.put(b"key", value)
+    value["items"].append(2)
+    
+    hit = cache.get(b"key")
+    hit["items"].append(3)
+    
+    assert cache.get(b"key") == {"items": [1]}
+
+
+def test_result_cache_evicts_least_recently_used():
+    cache = ResultCache(maxsize=2)
+    cache.put(b"a", 1)
+    cache.put(b"b", 2)
+    cache.get(b"a")
+    cache.put(b"c", 3)
+    
+    assert cache.get(b"b") is None
+    assert cache.get(b"a") == 1
+    assert cache.info()["size"] == 2
+
+
+def test_single_flight_coalesces_identical_calls():
+    calls = []
+    
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"items": [1]}
+    
+    async def main():
+        flight = SingleFlight()
+        first, second = await asyncio.gather(
+            flight.run(b"key", fetch), flight.run(b"key", fetch)
+        )
+        first["items"].append(2)
+        return second
+    
+    assert asyncio.run(main()) == {"items": [1]}
+    assert len(calls) == 1
+
+
+def test_single_flight_propagates_errors_to_every_caller():
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+    
+    async def main():
+        flight = SingleFlight()
+        return await asyncio.gather(
+            flight.run(b"key", fail), flight.run(b"key", fail),
+            return_exceptions=True
+        )
+    
+    results = asyncio.run(main())
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_cancelling_first_caller_does_not_cancel_others():
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return "done"
+    
+    async def main():
+        flight = SingleFlight()
+        first = asyncio.ensure_future(flight.run(b"key", fetch))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(flight.run(b"key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+    
+    assert asyncio.run(main()) == "done"
+
+
+def test_run_blocking_sees_caller_context():
+    async def main():
+        REQUEST_ID.set("abc")
+        return await Caller()._run_blocking(None, REQUEST_ID.get)
+    
+    assert asyncio.run(main()) == "abc"
+
+
+def test_run_blocking_coalesces_by_key():
+    calls = []
+    release = threading.Event()
+    
+    def work(value):
+        calls.append(value)
+        release.wait(1)
+        return [value]
+    
+    async def main():
+        caller = Caller()
+        first = asyncio.ensure_future(caller._run_blocking(b"key", work, 1))
+        second = asyncio.ensure_future(caller._run_blocking(b"key", work, 1))
+        await asyncio.sleep(0.01)
+        release.set()
+        return await asyncio.gather(first, second)
+    
+    assert asyncio.run(main()) == [[1], [1]]
+    assert calls == [1]
@@ -0,0 +1,70 @@
+"""
+Tests for the client pool behind the quick helpers
+Covers per-loop reuse, replacement across loops and explicit closing
+"""
+
+import asyncio
+import gc
+import weakref
+
+import pytest
+
+import parserator
+
+
+class FakeClient:
+    """Client that records parse calls and whether it was closed."""
+    
+    def __init__(self, api_key, **kwargs):
+        self.calls = 0
+        self.closed = False
+    
+    async def parse(self, **kwargs):
+        self.calls += 1
+        return kwargs
+    
+    async def aclose(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def fake_pool(monkeypatch):
+    monkeypatch.setattr(parserator, "_CLIENT_POOL", {})
+    monkeypatch.setattr(parserator, "ParseratorClient", FakeClient)
+
+
+def quick_parse():
+    return parserator.quick_parse("pk_test", "text", {"name": "string"})
+
+
+def test_calls_on_one_loop_share_a_client():
+    async def main():
+        await quick_parse()
+        await quick_parse()
+        return parserator._CLIENT_POOL["pk_test"][1]
+    
+    assert asyncio.run(main()).calls == 2
+
+
+def test_client_from_finished_loop_is_released():
+    async def main():
+        await quick_parse()
+        return parserator._CLIENT_POOL["pk_test"][1]
+    
+    first = weakref.ref(asyncio.run(main()))
+    asyncio.run(main())
+    gc.collect()
+    
+    assert first() is None
+    assert len(parserator._CLIENT_POOL) == 1
+
+
+def test_close_pooled_clients_closes_and_empties_pool():
+    async def main():
+        await quick_parse()
+        client = parserator._CLIENT_POOL["pk_test"][1]
+        await parserator.close_pooled_clients()
+        return client
+    
+    assert asyncio.run(main()).closed
+    assert parserator._CLIENT_POOL == {}
@@ -0,0 +1,101 @@
+"""
+Tests for ParseatorTool batch parsing
+Covers the server batch path, its cache use and the single-call fallback
+"""
+
+from types import SimpleNamespace
+
+from parserator.integrations.crewai import ParseatorTool
+
+
+def result(text):
+    return SimpleNamespace(
+        success=True,
+        error_message=None,
+        parsed_data={"name": text.upper()},
+        metadata={"confidence": 0.9}
+    )
+
+
+class SingleClient:
+    """Client with only the single-input parse call."""
+    
+    def __init__(self):
+        self.parsed = []
+    
+    def parse(self, input_data, output_schema, instructions=None):
+        self.parsed.append(input_data)
+        return result(input_data)
+
+
+class BatchClient(SingleClient):
+    """Client with a request-object batch_parse, like the SDK client."""
+    
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+    
+    def batch_parse(self, request):
+        texts = [item.input_data for item in request.items]
+        self.batches.append(texts)
+        return SimpleNamespace(results=[result(text) for text in texts])
+
+
+class FailingBatchClient(SingleClient):
+    """Client whose batch_parse uses an incompatible signature."""
+    
+    def batch_parse(self, inputs, output_schema, instructions):
+        raise AssertionError("not reached")
+
+
+def make_tool(client, cache=True):
+    # CrewAI is optional, so build the tool without BaseTool's __init__
+    tool = ParseatorTool.__new__(ParseatorTool)
+    tool.client = client
+    tool._init_cache(cache)
+    return tool
+
+
+def names(responses):
+    return [response["parsed_data"]["name"] for response in responses]
+
+
+def test_batch_endpoint_sends_one_request():
+    client = BatchClient()
+    
+    responses = make_tool(client)._run_batch(["ann", "bob"], {"name": "string"})
+    
+    assert names(responses) == ["ANN", "BOB"]
+    assert client.batches == [["ann", "bob"]]
+    assert client.parsed == []
+
+
+def test_batch_endpoint_only_sends_uncached_inputs():
+    client = BatchClient()
+    tool = make_tool(client)
+    tool._run("ann", {"name": "string"})
+    
+    responses = tool._run_batch(["ann", "bob"], {"name": "string"})
+    
+    assert names(responses) == ["ANN", "BOB"]
+    assert client.batches == [["bob"]]
+    assert tool._run_batch(["ann", "bob"], {"name": "string"}) == responses
+    assert client.batches == [["bob"]]
+
+
+def test_failed_batch_call_falls_back_to_single_calls():
+    client = FailingBatchClient()
+    
+    responses = make_tool(client)._run_batch(["ann", "bob"], {"name": "string"})
+    
+    assert names(responses) == ["ANN", "BOB"]
+    assert sorted(client.parsed) == ["ann", "bob"]
+
+
+def test_client_without_batch_endpoint_uses_single_calls():
+    client = SingleClient()
+    
+    responses = make_tool(client, cache=False)._run_batch(["ann", "bob"], {"name": "string"})
+    
+    assert names(responses) == ["ANN", "BOB"]
+    assert sorted(client.parsed) == ["ann", "bob"]
@@ -0,0 +1,90 @@
+"""
+Tests for the parse_dataframe helper
+Covers row filtering, index alignment and parsed_ column handling
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+import parserator
+
+
+class FakeClient:
+    """Client whose batch_parse upper-cases each input into a name field."""
+    
+    def __init__(self, api_key, **kwargs):
+        self.inputs = []
+    
+    async def batch_parse(self, request):
+        texts = [item.input_data for item in request.items]
+        self.inputs.extend(texts)
+        return SimpleNamespace(
+            results=[SimpleNamespace(parsed_data={"name": text.upper()}) for text in texts]
+        )
+
+
+class ShortBatchClient(FakeClient):
+    """Client whose batch_parse drops the last result."""
+    
+    async def batch_parse(self, request):
+        response = await super().batch_parse(request)
+        response.results.pop()
+        return response
+
+
+@pytest.fixture
+def client_class(monkeypatch):
+    """Route pooled clients to FakeClient, with a fresh pool per test."""
+    monkeypatch.setattr(parserator, "_CLIENT_POOL", {})
+    monkeypatch.setattr(parserator, "ParseratorClient", FakeClient)
+    return FakeClient
+
+
+def parse(df):
+    return asyncio.run(
+        parserator.parse_dataframe("pk_test", df, "text", {"name": "string"})
+    )
+
+
+def test_blank_and_missing_rows_are_not_sent(client_class):
+    df = pd.DataFrame({"text": ["ann", None, "   ", float("nan"), "bob"]})
+    
+    result = parse(df)
+    
+    _, client = parserator._CLIENT_POOL["pk_test"]
+    assert client.inputs == ["ann", "bob"]
+    assert result["parsed_name"].tolist()[0] == "ANN"
+    assert result["parsed_name"].tolist()[4] == "BOB"
+    assert result["parsed_name"].iloc[1:4].isna().all()
+
+
+def test_results_align_with_non_range_index(client_class):
+    df = pd.DataFrame({"text": ["ann", "", "bob"]}, index=[30, 10, 20])
+    
+    result = parse(df)
+    
+    assert list(result.index) == [30, 10, 20]
+    assert result.loc[30, "parsed_name"] == "ANN"
+    assert pd.isna(result.loc[10, "parsed_name"])
+    assert result.loc[20, "parsed_name"] == "BOB"
+
+
+def test_existing_parsed_columns_are_replaced(client_class):
+    df = pd.DataFrame({"text": ["ann"], "parsed_name": ["stale"]})
+    
+    result = parse(df)
+    
+    assert list(result.columns) == ["text", "parsed_name"]
+    assert result.loc[0, "parsed_name"] == "ANN"
+
+
+def test_short_batch_response_raises(client_class, monkeypatch):
+    monkeypatch.setattr(parserator, "ParseratorClient", ShortBatchClient)
+    df = pd.DataFrame({"text": ["ann", "bob"]})
+    
+    with pytest.raises(parserator.ParseratorError):
+        parse(df)